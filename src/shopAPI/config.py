@@ -14,7 +14,14 @@ class Settings(BaseSettings):
     DB_HOST: str = Field("localhost", json_schema_extra={"env": "DB_HOST"})
     DB_PORT: int | str = Field("5432", json_schema_extra={"env": "DB_PORT"})
     DB_ECHO: bool = Field(False, json_schema_extra={"env": "DB_ECHO"})
-    DB_POOL_SIZE: int = Field(5, json_schema_extra={"env": "DB_POOL_SIZE"})
+    DB_RAISELOAD: bool = Field(False, json_schema_extra={"env": "DB_RAISELOAD"})
+    DB_POOL_SIZE: int = Field(20, json_schema_extra={"env": "DB_POOL_SIZE"})
+    DB_MAX_OVERFLOW: int = Field(10, json_schema_extra={"env": "DB_MAX_OVERFLOW"})
+    DB_POOL_TIMEOUT: int = Field(30, json_schema_extra={"env": "DB_POOL_TIMEOUT"})
+    DB_POOL_PRE_PING: bool = Field(True, json_schema_extra={"env": "DB_POOL_PRE_PING"})
+    DB_QUERY_CACHE_SIZE: int = Field(
+        1200, json_schema_extra={"env": "DB_QUERY_CACHE_SIZE"}
+    )
     DB_URI: Optional[PostgresDsn] = None
 
     model_config = SettingsConfigDict(case_sensitive=True, env_file=".env")
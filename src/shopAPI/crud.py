@@ -1,23 +1,50 @@
-from typing import Any, Generic, List, Type, TypeVar
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, Generic, List, Type, TypeVar
 from uuid import UUID
 from fastapi import Depends
 from pydantic import BaseModel
 from sqlmodel import SQLModel
-from sqlalchemy import Select
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql.expression import select
-from sqlalchemy.orm import selectinload
-from functools import reduce
+from sqlalchemy.sql import lambda_stmt
+from sqlalchemy.sql.expression import select, update
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
+from shopAPI.config import settings
 from shopAPI.database import Transactional, get_session
 from shopAPI.models import Order, OrderItem, Product
 
 ModelType = TypeVar("ModelType", bound=SQLModel)
 
+_SCALAR_TYPES = (str, int, float, bool, UUID, datetime, Enum)
+
+
+@lru_cache(maxsize=None)
+def _scalar_fields(schema_class: Type[BaseModel]) -> frozenset[str]:
+    """
+    Returns the names of the schema fields that are dumped as is by model_dump.
+
+    :param schema_class: The schema class.
+    :return: The scalar field names.
+    """
+    return frozenset(
+        name
+        for name, field in schema_class.model_fields.items()
+        if isinstance(field.annotation, type)
+        and issubclass(field.annotation, _SCALAR_TYPES)
+    )
+
 
 class BaseCRUD(Generic[ModelType]):
     """Base class for CRUD operations."""
 
+    _stmt_cache: ClassVar[dict[tuple, StatementLambdaElement]] = {}
+    _JOIN_DISPATCH: ClassVar[dict[str, Callable]] = {}
+
     def __init__(self, model: Type[ModelType], session: AsyncSession):
         self.session = session
         self.model_class = model
@@ -55,7 +82,9 @@ class BaseCRUD(Generic[ModelType]):
         :param limit: The number of items to return.
         :return: The list of model instances.
         """
-        return await self._all(self._query(join_).offset(offset).limit(limit))
+        query = self._query(join_)
+        query += lambda s: s.offset(offset).limit(limit)
+        return await self._all(query)
 
     async def get_all_by_ids(
         self, ids: list[UUID], join_: set[str] | None = None
@@ -73,15 +102,34 @@ class BaseCRUD(Generic[ModelType]):
     async def update(self, model: ModelType, model_update: ModelType) -> ModelType:
         """
         Updated the model instance.
+        Only the attributes that differ from the current values are set.
+        A model that belongs to this session is updated with a single UPDATE
+        statement and synchronized by the session, any other model is updated
+        through its attributes.
 
         :param model: The model to update.
         :param model_update: The model containing the attributes to update.
         :return: The updated model instance.
         """
-        attributes: dict[str, Any] = self.extract_attributes_from_schema(model_update)
-        for k, v in attributes.items():
-            setattr(model, k, v)
-        self.session.add(model)
+        attributes: dict[str, Any] = {
+            k: v
+            for k, v in self.extract_attributes_from_schema(model_update).items()
+            if getattr(model, k) != v
+        }
+        if not attributes:
+            return model
+
+        if model not in self.session:
+            for k, v in attributes.items():
+                setattr(model, k, v)
+            self.session.add(model)
+            return model
+
+        await self.session.execute(
+            update(self.model_class)
+            .where(self.model_class.id == model.id)
+            .values(**attributes)
+        )
         return model
 
     @Transactional()
@@ -94,19 +142,31 @@ class BaseCRUD(Generic[ModelType]):
         """
         await self.session.delete(model)
 
-    def _query(self, join_: set[str] | None = None) -> Select:
+    def _query(self, join_: set[str] | None = None) -> StatementLambdaElement:
         """
-        Returns a callable that can be used to query the model.
+        Returns a cached lambda statement that can be used to query the model.
+        Statements are cached per model class and set of joins,
+        so SQLAlchemy can reuse the already constructed and compiled query.
 
         :param join_: The joins to make.
-        :return: A callable that can be used to query the model.
+        :return: A lambda statement that can be used to query the model.
         """
-        query = select(self.model_class)
-        query = self._optional_join(query, join_)
+        if join_ and not isinstance(join_, set):
+            raise TypeError("join_ must be a set")
+
+        key = (self.model_class, frozenset(join_) if join_ else None)
+        query = self._stmt_cache.get(key)
+        if query is None:
+            model_class = self.model_class
+            query = lambda_stmt(lambda: select(model_class), track_on=[model_class])
+            query = self._optional_join(query, join_)
+            if settings.DB_RAISELOAD:
+                query += lambda s: s.options(raiseload("*"))
+            self._stmt_cache[key] = query
 
         return query
 
-    async def _all(self, query: Select) -> list[ModelType]:
+    async def _all(self, query: StatementLambdaElement) -> list[ModelType]:
         """
         Returns all results from the query.
 
@@ -116,7 +176,7 @@ class BaseCRUD(Generic[ModelType]):
         query = await self.session.scalars(query)
         return query.all()
 
-    async def _one_or_none(self, query: Select) -> ModelType | None:
+    async def _one_or_none(self, query: StatementLambdaElement) -> ModelType | None:
         """Returns the first result from the query or None.
 
         :param query: The query to execute.
@@ -125,7 +185,9 @@ class BaseCRUD(Generic[ModelType]):
         query = await self.session.scalars(query)
         return query.one_or_none()
 
-    def _where(self, query: Select, field: str, value: Any) -> Select:
+    def _where(
+        self, query: StatementLambdaElement, field: str, value: Any
+    ) -> StatementLambdaElement:
         """
         Returns the query filtered by the given column.
 
@@ -134,12 +196,15 @@ class BaseCRUD(Generic[ModelType]):
         :param value: The value to filter by.
         :return: The filtered query.
         """
+        column = getattr(self.model_class, field)
         if isinstance(value, (list, tuple)):
-            return query.where(getattr(self.model_class, field).in_(value))
+            return query + (lambda s: s.where(column.in_(value)))
         else:
-            return query.where(getattr(self.model_class, field) == value)
+            return query + (lambda s: s.where(column == value))
 
-    def _optional_join(self, query: Select, join_: set[str] | None = None) -> Select:
+    def _optional_join(
+        self, query: StatementLambdaElement, join_: set[str] | None = None
+    ) -> StatementLambdaElement:
         """
         Returns the query with the given joins.
 
@@ -150,20 +215,12 @@ class BaseCRUD(Generic[ModelType]):
         if not join_:
             return query
 
-        if not isinstance(join_, set):
-            raise TypeError("join_ must be a set")
-
-        return reduce(self._add_join_to_query, join_, query)
-
-    def _add_join_to_query(self, query: Select, join_: set[str]) -> Select:
-        """
-        Returns the query with the given join.
-
-        :param query: The query to join.
-        :param join_: The join to make.
-        :return: The query with the given join.
-        """
-        return getattr(self, "_join_" + join_)(query)
+        options = [self._JOIN_DISPATCH[j]() for j in join_]
+        return query.add_criteria(
+            lambda s: s.options(*options),
+            track_on=[self.model_class, frozenset(join_)],
+            track_closure_variables=False,
+        )
 
     @staticmethod
     def extract_attributes_from_schema(
@@ -176,6 +233,9 @@ class BaseCRUD(Generic[ModelType]):
         :param excludes: The attributes to exclude.
         :return: The attributes.
         """
+        fields_set = schema.__pydantic_fields_set__
+        if not excludes and fields_set <= _scalar_fields(type(schema)):
+            return {k: getattr(schema, k) for k in fields_set}
 
         return schema.model_dump(exclude=excludes, exclude_unset=True)
 
@@ -194,24 +254,38 @@ class OrderCRUD(BaseCRUD[Order]):
     CRUD for the order model.
     """
 
+    _JOIN_DISPATCH = {
+        "order_items": lambda: selectinload(Order.order_items).selectinload(
+            OrderItem.product
+        ),
+    }
+
     def __init__(self, session: AsyncSession = Depends(get_session)):
         super().__init__(model=Order, session=session)
 
     @Transactional()
     async def create(self, model_create: ModelType) -> ModelType:
         """
-        Creates a new order in the DB. Updates the products amount.
+        Creates a new order in the DB with a bulk insert of its order items.
+        Updates the products amount.
 
         :param model_create: The order to create.
-        :return: The created order instance.
+        :return: The created order instance with its order items loaded.
         """
 
         attributes = self.extract_attributes_from_schema(model_create)
+        order_items = attributes.pop("order_items")
         model = self.model_class(**attributes)
         self.session.add(model)
-        for order_item in model.order_items:
-            product = await self.session.get(Product, order_item.product_id)
-            product.amount -= order_item.amount
+        await self.session.flush()
+        created_order_items = await self.session.scalars(
+            insert(OrderItem).returning(OrderItem),
+            [{"order_id": model.id, **order_item} for order_item in order_items],
+        )
+        set_committed_value(model, "order_items", created_order_items.all())
+        for order_item in order_items:
+            product = await self.session.get(Product, order_item["product_id"])
+            product.amount -= order_item["amount"]
         return model
 
     async def get_by_id(self, id: UUID) -> ModelType:
@@ -221,7 +295,7 @@ class OrderCRUD(BaseCRUD[Order]):
         :param id: The id to match.
         :return: The order instance.
         """
-        return await super().get_by_id(id=id, join_={"order_item"})
+        return await super().get_by_id(id=id, join_={"order_items"})
 
     async def get_all(self, offset: int, limit: int) -> List[ModelType]:
         """
@@ -231,15 +305,4 @@ class OrderCRUD(BaseCRUD[Order]):
         :param limit: The number of items to return.
         :return: The list of order instances.
         """
-        return await super().get_all(offset=offset, limit=limit, join_={"order_item"})
-
-    def _join_order_item(self, query: Select) -> Select:
-        """
-        Joins order_item table.
-
-        :param query: The query to join.
-        :return: Query.
-        """
-        return query.options(
-            selectinload(Order.order_items).selectinload(OrderItem.product)
-        )
+        return await super().get_all(offset=offset, limit=limit, join_={"order_items"})
@@ -68,6 +68,10 @@ engine = create_async_engine(
     echo=settings.DB_ECHO,
     future=True,
     pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
 )
 
 session = prepare_session(engine)
@@ -78,6 +82,11 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
     Get the database session.
     This can be used for dependency injection.
 
+    FastAPI caches this dependency per request, so all CRUDs used by a route
+    share one session and one connection. CRUDs must receive the session
+    through Depends(get_session); request handling code must not create
+    sessions from the session factory on its own.
+
     :return: The database session.
     """
     try:
@@ -1,5 +1,6 @@
 from datetime import datetime
 import enum
+from functools import lru_cache
 from typing import Any, Dict
 from uuid import UUID
 from pydantic import (
@@ -35,12 +36,15 @@ class ResponseMessage(SQLModel):
     detail: str
 
 
+@lru_cache(maxsize=None, typed=True)
 def field_example(param: Any) -> Dict[str, Dict[str, Any]]:
     """
     Returns field example for swagger documentation
 
     It's a workaround for SQLModel bug,
     see https://github.com/tiangolo/sqlmodel/discussions/833
+
+    The result is cached per example value, so the param must be hashable.
     """
     return {"schema_extra": {"json_schema_extra": {"example": param}}}
 
@@ -83,9 +87,10 @@ class ProductResponse(ProductBase):
     id: UUID
 
 
-class ProductResponseInOrderItem(ProductResponse):
-    description: str = Field(exclude=True)
-    amount: int = Field(exclude=True)
+class ProductResponseInOrderItem(SQLModel):
+    id: UUID
+    name: str = Field(**field_example("Product"))
+    price: float = Field(**field_example(128.99))
 
 
 class OrderStatus(str, enum.Enum):
@@ -111,11 +116,6 @@ class Order(IdMixin, OrderBase, table=True):
         sa_relationship_kwargs={"cascade": "all"}, back_populates="order"
     )
 
-    def __init__(self, **kwargs):
-        order_items = kwargs.pop("order_items", [])
-        super().__init__(**kwargs)
-        self.order_items = [OrderItem(**order_item) for order_item in order_items]
-
 
 class OrderCreate(OrderBase):
     order_items: list["OrderItemCreate"] = Field(min_length=1)
@@ -134,7 +134,7 @@ class OrderResponse(OrderBase):
 
     @field_serializer("creation_date", return_type=str, when_used="json")
     def serialize_creation_date(self, creation_date: datetime):
-        return creation_date.strftime("%Y-%m-%d %H:%M:%S")
+        return creation_date.isoformat(sep=" ", timespec="seconds")
 
 
 class OrderResponseWithItems(OrderResponse):
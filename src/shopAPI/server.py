@@ -1,7 +1,50 @@
+from contextlib import asynccontextmanager
+import logging
+from typing import AsyncIterator
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid_extensions import uuid7
 
 from shopAPI.routers import api_router, status_router
 from shopAPI.config import settings
+from shopAPI.crud import OrderCRUD, ProductCRUD
+from shopAPI.database import engine
+
+logger = logging.getLogger(__name__)
+
+
+async def warm_up_queries() -> None:
+    """
+    Runs the read queries of all CRUDs once inside a rolled back transaction,
+    so their statements are compiled and cached before the first request.
+
+    :return: None
+    """
+    async with engine.connect() as connection:
+        await connection.begin()
+        session = AsyncSession(bind=connection)
+        try:
+            for crud in (ProductCRUD(session=session), OrderCRUD(session=session)):
+                await crud.get_by_id(id=uuid7())
+                await crud.get_all_by_ids(ids=[uuid7()])
+                await crud.get_all(offset=0, limit=1)
+        finally:
+            await session.close()
+            await connection.rollback()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Warms up the query cache on startup.
+    The warm-up is best-effort, a failure is logged and the app starts anyway.
+    """
+    try:
+        await warm_up_queries()
+    except Exception:
+        logger.exception("Query cache warm-up failed.")
+    yield
 
 
 def get_application() -> FastAPI:
@@ -9,6 +52,8 @@ def get_application() -> FastAPI:
         title=settings.PROJECT_NAME,
         version=settings.VERSION,
         docs_url="/swagger",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
     app.include_router(api_router, prefix="/api")
     app.include_router(status_router)
@@ -2,8 +2,10 @@ from typing import List
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
 
-from shopAPI.models import OrderStatus
+from shopAPI.crud import OrderCRUD
+from shopAPI.models import OrderCreate, OrderItem, OrderStatus
 import tests.utils as utils
 
 
@@ -104,3 +106,33 @@ async def test_post_order_products_amount(
     await utils.compare_db_products_amount(
         products_amount.fromkeys(products_amount, 0), db_session
     )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("product_payloads", [5, 1], indirect=True)
+@pytest.mark.parametrize("order_payloads", [1], indirect=True)
+async def test_create_order_items_loaded(
+    order_payloads: List[dict],
+    db_session: AsyncSession,
+) -> None:
+    # Create an order with the CRUD and check that the returned order items
+    # match the payload and the rows stored in the DB
+    order_payload = order_payloads[0]
+    order = await OrderCRUD(session=db_session).create(
+        OrderCreate.model_validate(order_payload)
+    )
+    expected_items = sorted(
+        (item["product_id"], item["amount"]) for item in order_payload["order_items"]
+    )
+    assert (
+        sorted((str(item.product_id), item.amount) for item in order.order_items)
+        == expected_items
+    )
+    db_order_items = (
+        await db_session.scalars(
+            select(OrderItem).where(OrderItem.order_id == order.id)
+        )
+    ).all()
+    assert {item.id for item in order.order_items} == {
+        item.id for item in db_order_items
+    }
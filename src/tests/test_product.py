@@ -69,6 +69,45 @@ async def test_put_product(
     await utils.compare_db_product_to_payload(updated_product, db_session)
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("product_payloads", [1], indirect=True)
+async def test_put_product_unchanged(
+    client: AsyncClient,
+    product_payloads: List[dict],
+    db_session: AsyncSession,
+) -> None:
+    # Create a product and update it with the same values
+    await utils.create_entities(client, "products", product_payloads)
+    created_product = product_payloads[0]
+    response_put = await client.put(
+        f"products/{created_product['id']}",
+        json={k: v for k, v in created_product.items() if k != "id"},
+    )
+    assert response_put.status_code == 200
+    assert response_put.json() == created_product
+    await utils.compare_db_product_to_payload(created_product, db_session)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("product_payloads", [1], indirect=True)
+async def test_put_product_partially_changed(
+    client: AsyncClient,
+    product_payloads: List[dict],
+    db_session: AsyncSession,
+) -> None:
+    # Create a product and update it with only the name changed
+    await utils.create_entities(client, "products", product_payloads)
+    created_product = product_payloads[0]
+    created_product["name"] = "test_name_updated"
+    response_put = await client.put(
+        f"products/{created_product['id']}",
+        json={k: v for k, v in created_product.items() if k != "id"},
+    )
+    assert response_put.status_code == 200
+    assert response_put.json() == created_product
+    await utils.compare_db_product_to_payload(created_product, db_session)
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("product_payloads", [1, 2], indirect=True)
 async def test_delete_product(
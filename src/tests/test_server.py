@@ -0,0 +1,18 @@
+import pytest
+
+from shopAPI.crud import BaseCRUD
+from shopAPI.models import Order, Product
+from shopAPI.server import warm_up_queries
+
+
+@pytest.mark.asyncio
+async def test_warm_up_queries(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Start from an empty statement cache and check that the warm-up fills it
+    # with the queries of every CRUD
+    monkeypatch.setattr(BaseCRUD, "_stmt_cache", {})
+    await warm_up_queries()
+    assert {
+        (Product, None),
+        (Order, None),
+        (Order, frozenset({"order_items"})),
+    } <= BaseCRUD._stmt_cache.keys()